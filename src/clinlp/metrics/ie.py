@@ -1,25 +1,58 @@
 """Classes and functions for evaluating information extraction tasks."""
 
-import inspect
+import functools
 import itertools
-import json
+import operator
 import pathlib
+import sys
 from collections import Counter, defaultdict
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import ClassVar
 
 import nervaluate
-from sklearn.metrics import f1_score, precision_score, recall_score
+import numpy as np
+import orjson
 from spacy.language import Doc
 
 from clinlp.ie import SPANS_KEY
 from clinlp.ie.qualifier import Qualifier
 
+_NERVALUATE_KEYS = ("text", "start", "end", "label")
 
-@dataclass
-class Annotation:
-    """An annotation in a document."""
+
+@functools.lru_cache(maxsize=1024)
+def _make_qualifier(name: str, value: str) -> Qualifier:
+    """
+    Make a title-cased qualifier, reusing instances for identical names and values.
+
+    ``Qualifier`` is immutable, so the same instance can safely be shared between
+    annotations. Names and values are interned, as they are drawn from a small
+    vocabulary and compared often.
+
+    Parameters
+    ----------
+    name
+        The name of the qualifier.
+    value
+        The value of the qualifier.
+
+    Returns
+    -------
+    ``Qualifier``
+        The qualifier, with title-cased name and value.
+    """
+    return Qualifier(name=sys.intern(name.title()), value=sys.intern(value.title()))
+
+
+@dataclass(slots=True)
+class Annotation(Mapping):
+    """
+    An annotation in a document.
+
+    Also a read-only mapping of the keys ``text``, ``start``, ``end`` and ``label``,
+    so that it can be passed to ``nervaluate`` directly.
+    """
 
     text: str
     """The text/str span of this annotation."""
@@ -45,8 +78,9 @@ class Annotation:
         chars
             The characters to strip from the beginning.
         """
-        self.start += len(self.text) - len(self.text.lstrip(chars))
-        self.text = self.text.lstrip(chars)
+        stripped = self.text.lstrip(chars)
+        self.start += len(self.text) - len(stripped)
+        self.text = stripped
 
     def rstrip(self, chars: str = " ,") -> None:
         """
@@ -57,8 +91,9 @@ class Annotation:
         chars
             The characters to strip from the end.
         """
-        self.end -= len(self.text) - len(self.text.rstrip(chars))
-        self.text = self.text.rstrip(chars)
+        stripped = self.text.rstrip(chars)
+        self.end -= len(self.text) - len(stripped)
+        self.text = stripped
 
     def strip(self, chars: str = " ,") -> None:
         """
@@ -69,8 +104,76 @@ class Annotation:
         chars
             The characters to strip from the beginning and end.
         """
-        self.lstrip(chars=chars)
-        self.rstrip(chars=chars)
+        lstripped = self.text.lstrip(chars)
+        self.start += len(self.text) - len(lstripped)
+        stripped = lstripped.rstrip(chars)
+        self.end -= len(lstripped) - len(stripped)
+        self.text = stripped
+
+    def __getitem__(self, key: str) -> str | int:
+        """
+        Get an item in ``nervaluate`` format.
+
+        Allows passing annotations to ``nervaluate`` directly, without converting them
+        to a ``dict`` first.
+
+        Parameters
+        ----------
+        key
+            The key, one of ``text``, ``start``, ``end`` or ``label``.
+
+        Returns
+        -------
+        ``str | int``
+            The value for the provided key.
+
+        Raises
+        ------
+        KeyError
+            If the key is not part of the ``nervaluate`` format.
+        """
+        if key not in _NERVALUATE_KEYS:
+            raise KeyError(key)
+
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the keys in ``nervaluate`` format.
+
+        Returns
+        -------
+        ``Iterator[str]``
+            An iterator over the keys ``text``, ``start``, ``end`` and ``label``.
+        """
+        return iter(_NERVALUATE_KEYS)
+
+    def __len__(self) -> int:
+        """
+        Get the number of keys in ``nervaluate`` format.
+
+        Returns
+        -------
+        ``int``
+            The number of keys.
+        """
+        return len(_NERVALUATE_KEYS)
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Check whether a key is part of the ``nervaluate`` format.
+
+        Parameters
+        ----------
+        key
+            The key.
+
+        Returns
+        -------
+        ``bool``
+            Whether the key is one of ``text``, ``start``, ``end`` or ``label``.
+        """
+        return key in _NERVALUATE_KEYS
 
     def to_nervaluate(self) -> dict:
         """
@@ -121,10 +224,27 @@ class Annotation:
         ``set[str]``
             A set of unique qualifier names, e.g. {"Presence", "Experiencer"}.
         """
-        if self.qualifiers is None:
-            return {}
+        return {qualifier.name for qualifier in self.qualifiers or []}
 
-        return {qualifier.name for qualifier in self.qualifiers}
+    def _get_qualifiers_by_name(self) -> dict[str, Qualifier]:
+        """
+        Get the qualifiers of this annotation, indexed by name.
+
+        The index is built from the current ``qualifiers`` on every call, so it is
+        not affected by changes to them. If multiple qualifiers have the same name,
+        the first one is used.
+
+        Returns
+        -------
+        ``dict[str, Qualifier]``
+            A mapping from qualifier names to qualifiers.
+        """
+        qualifiers_by_name: dict[str, Qualifier] = {}
+
+        for qualifier in self.qualifiers or []:
+            qualifiers_by_name.setdefault(qualifier.name, qualifier)
+
+        return qualifiers_by_name
 
     def get_qualifier_by_name(self, qualifier_name: str) -> Qualifier:
         """
@@ -145,15 +265,14 @@ class Annotation:
         KeyError
             If no qualifier with the provided name exists.
         """
-        for qualifier in self.qualifiers:
-            if qualifier.name == qualifier_name:
-                return qualifier
+        try:
+            return self._get_qualifiers_by_name()[qualifier_name]
+        except KeyError:
+            msg = f"No qualifier with name {qualifier_name}."
+            raise KeyError(msg) from None
 
-        msg = f"No qualifier with name {qualifier_name}."
-        raise KeyError(msg)
 
-
-@dataclass
+@dataclass(slots=True)
 class Document:
     """Document (any text) with annotations."""
 
@@ -166,6 +285,29 @@ class Document:
     annotations: list[Annotation]
     """A list of annotations."""
 
+    def _filter_annotations(
+        self, ann_filter: Callable[[Annotation], bool] | None = None
+    ) -> list[Annotation]:
+        """
+        Filter the annotations of this document.
+
+        Parameters
+        ----------
+        ann_filter
+            A filter to apply to annotations. Should map the annotations to ``True``
+            if they should be included, ``False`` otherwise. If ``None``, all
+            annotations are included.
+
+        Returns
+        -------
+        ``list[Annotation]``
+            The annotations that pass the filter.
+        """
+        if ann_filter is None:
+            return self.annotations
+
+        return [ann for ann in self.annotations if ann_filter(ann)]
+
     def to_nervaluate(
         self, ann_filter: Callable[[Annotation], bool] | None = None
     ) -> list[dict]:
@@ -183,9 +325,7 @@ class Document:
         ``list[dict]``
             A list of dictionaries corresponding to annotations.
         """
-        ann_filter = ann_filter or (lambda _: True)
-
-        return [ann.to_nervaluate() for ann in self.annotations if ann_filter(ann)]
+        return [ann.to_nervaluate() for ann in self._filter_annotations(ann_filter)]
 
     def to_dict(self) -> dict:
         """
@@ -219,13 +359,7 @@ class Document:
         ``set[str]``
             A set containing all annotation labels for this document.
         """
-        ann_filter = ann_filter or (lambda _: True)
-
-        return {
-            annotation.label
-            for annotation in self.annotations
-            if ann_filter(annotation)
-        }
+        return {annotation.label for annotation in self._filter_annotations(ann_filter)}
 
     def get_annotation_from_span(self, start: int, end: int) -> Annotation | None:
         """
@@ -251,21 +385,13 @@ class Document:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class InfoExtractionDataset:
     """A dataset with annotated documents."""
 
     docs: list[Document]
     """The annotated documents."""
 
-    _ALL_STATS: ClassVar[list] = [
-        "num_docs",
-        "num_annotations",
-        "span_freqs",
-        "label_freqs",
-        "qualifier_freqs",
-    ]
-
     @classmethod
     def from_clinlp_docs(
         cls,
@@ -295,25 +421,23 @@ class InfoExtractionDataset:
         """
         ids = ids or itertools.count()
 
-        docs = []
-
-        for doc, identifier in zip(nlp_docs, ids, strict=False):
-            annotations = [
-                Annotation(
-                    text=str(ent),
-                    start=ent.start_char,
-                    end=ent.end_char,
-                    label=ent.label_,
-                    qualifiers=ent._.qualifiers,
-                )
-                for ent in doc.spans[spans_key]
-            ]
-
-            docs.append(
-                Document(
-                    identifier=str(identifier), text=doc.text, annotations=annotations
-                )
+        docs = [
+            Document(
+                identifier=str(identifier),
+                text=doc.text,
+                annotations=[
+                    Annotation(
+                        text=ent.text,
+                        start=ent.start_char,
+                        end=ent.end_char,
+                        label=sys.intern(ent.label_),
+                        qualifiers=ent._.qualifiers,
+                    )
+                    for ent in doc.spans[spans_key]
+                ],
             )
+            for doc, identifier in zip(nlp_docs, ids, strict=False)
+        ]
 
         return cls(docs=docs)
 
@@ -360,10 +484,7 @@ class InfoExtractionDataset:
             for annotation in doc["annotations"]:
                 if not annotation["deleted"]:
                     qualifiers = [
-                        Qualifier(
-                            name=qualifier["name"].title(),
-                            value=qualifier["value"].title(),
-                        )
+                        _make_qualifier(qualifier["name"], qualifier["value"])
                         for qualifier in annotation["meta_anns"].values()
                     ]
 
@@ -371,7 +492,7 @@ class InfoExtractionDataset:
                         text=annotation["value"],
                         start=annotation["start"],
                         end=annotation["end"],
-                        label=annotation["cui"],
+                        label=sys.intern(annotation["cui"]),
                         qualifiers=qualifiers,
                     )
 
@@ -433,8 +554,7 @@ class InfoExtractionDataset:
         ``InfoExtractionDataset``
             A dataset, corresponding to the data in the provided file.
         """
-        with pathlib.Path(file).open() as f:
-            data = json.load(f)
+        data = orjson.loads(pathlib.Path(file).read_bytes())
 
         return cls.from_dict(data)
 
@@ -455,8 +575,6 @@ class InfoExtractionDataset:
         ``list[list[dict]]``
             A list of lists of dictionaries corresponding to annotations.
         """
-        ann_filter = ann_filter or (lambda _: True)
-
         return [doc.to_nervaluate(ann_filter) for doc in self.docs]
 
     def to_dict(self) -> dict:
@@ -479,8 +597,9 @@ class InfoExtractionDataset:
         file
             The path to the file.
         """
-        with pathlib.Path(file).open("w") as f:
-            json.dump(self.to_dict(), f, indent=4)
+        pathlib.Path(file).write_bytes(
+            orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+        )
 
     def num_docs(self) -> int:
         """
@@ -504,6 +623,92 @@ class InfoExtractionDataset:
         """
         return sum(len(doc.annotations) for doc in self.docs)
 
+    def _count_freqs(
+        self,
+        span_callback: Callable | None = None,
+        label_callback: Callable | None = None,
+        *,
+        count_spans: bool = True,
+        count_labels: bool = True,
+        count_qualifiers: bool = True,
+    ) -> tuple[Counter, Counter, dict[str, Counter]]:
+        """
+        Count text spans, labels and qualifier values in one walk over the documents.
+
+        Parameters
+        ----------
+        span_callback
+            A callback applied to each text span.
+        label_callback
+            A callback applied to each label.
+        count_spans
+            Whether to count text spans.
+        count_labels
+            Whether to count labels.
+        count_qualifiers
+            Whether to count qualifier values.
+
+        Returns
+        -------
+        ``Counter``
+            The counts of all text spans, empty if not counted.
+        ``Counter``
+            The counts of all labels, empty if not counted.
+        ``dict[str, Counter]``
+            The counts of all qualifier values, per qualifier name, empty if not
+            counted.
+        """
+        span_cntr = Counter()
+        label_cntr = Counter()
+        qualifier_cntrs = defaultdict(Counter)
+
+        get_text = operator.attrgetter("text")
+        get_label = operator.attrgetter("label")
+
+        for doc in self.docs:
+            # Counter.update counts iterables in C, so only map callbacks if given
+            if count_spans:
+                spans = map(get_text, doc.annotations)
+                span_cntr.update(
+                    spans if span_callback is None else map(span_callback, spans)
+                )
+
+            if count_labels:
+                labels = map(get_label, doc.annotations)
+                label_cntr.update(
+                    labels if label_callback is None else map(label_callback, labels)
+                )
+
+            if count_qualifiers:
+                for annotation in doc.annotations:
+                    if annotation.qualifiers is not None:
+                        for qualifier in annotation.qualifiers:
+                            qualifier_cntrs[qualifier.name][qualifier.value] += 1
+
+        return span_cntr, label_cntr, qualifier_cntrs
+
+    @staticmethod
+    def _most_common(cntr: Counter, n: int | None) -> dict:
+        """
+        Get the most common items of a counter.
+
+        Parameters
+        ----------
+        cntr
+            The counter.
+        n
+            The ``n`` most common items to return, or ``None`` for all items.
+
+        Returns
+        -------
+        ``dict``
+            A dictionary containing the ``n`` most common items and their counts.
+        """
+        if n is None:
+            n = len(cntr)
+
+        return dict(cntr.most_common(n))
+
     def span_freqs(
         self,
         n_spans: int | None = 25,
@@ -525,18 +730,11 @@ class InfoExtractionDataset:
         ``dict``
             A dictionary containing the frequency of the requested text spans.
         """
-        cntr = Counter()
-        span_callback = span_callback or (lambda x: x)
-
-        for doc in self.docs:
-            cntr.update(
-                [span_callback(annotation.text) for annotation in doc.annotations]
-            )
-
-        if n_spans is None:
-            n_spans = len(cntr)
+        span_cntr, _, _ = self._count_freqs(
+            span_callback=span_callback, count_labels=False, count_qualifiers=False
+        )
 
-        return dict(cntr.most_common(n_spans))
+        return self._most_common(span_cntr, n_spans)
 
     def label_freqs(
         self,
@@ -558,18 +756,11 @@ class InfoExtractionDataset:
         ``dict``
             A dictionary containing the frequency of the requested labels.
         """
-        cntr = Counter()
-        label_callback = label_callback or (lambda x: x)
-
-        for doc in self.docs:
-            cntr.update(
-                [label_callback(annotation.label) for annotation in doc.annotations]
-            )
-
-        if n_labels is None:
-            n_labels = len(cntr)
+        _, label_cntr, _ = self._count_freqs(
+            label_callback=label_callback, count_spans=False, count_qualifiers=False
+        )
 
-        return dict(cntr.most_common(n_labels))
+        return self._most_common(label_cntr, n_labels)
 
     def qualifier_freqs(self) -> dict:
         """
@@ -581,23 +772,35 @@ class InfoExtractionDataset:
             The computed frequencies, as a mapping from qualifier names to values to
             frequencies, e.g. ``{"Presence": {"Present": 25, "Absent": 10}, ...}``.
         """
-        cntrs = defaultdict(lambda: Counter())
-
-        for doc in self.docs:
-            for annotation in doc.annotations:
-                if annotation.qualifiers is not None:
-                    for qualifier in annotation.qualifiers:
-                        cntrs[qualifier.name].update([qualifier.value])
+        _, _, qualifier_cntrs = self._count_freqs(count_spans=False, count_labels=False)
 
-        return {name: dict(counts) for name, counts in cntrs.items()}
+        return {name: dict(counts) for name, counts in qualifier_cntrs.items()}
 
-    def stats(self, **kwargs) -> dict:
+    def stats(
+        self,
+        n_spans: int | None = 25,
+        span_callback: Callable | None = None,
+        n_labels: int | None = 25,
+        label_callback: Callable | None = None,
+        **_,
+    ) -> dict:
         """
         Compute all statistics for this dataset.
 
-        Combines the return values of all stats functions, defined in the ``_ALL_STATS``
-        class variable. Any additional keyword arguments are passed to the respective
-        stats functions, if they accept them.
+        Combines the return values of ``num_docs``, ``num_annotations``,
+        ``span_freqs``, ``label_freqs`` and ``qualifier_freqs``, while only passing
+        over the annotations once. Any other keyword arguments are ignored.
+
+        Parameters
+        ----------
+        n_spans
+            The ``n`` most frequent text spans to return.
+        span_callback
+            A callback applied to each text span.
+        n_labels
+            The ``n`` most frequent labels to return.
+        label_callback
+            A callback applied to each label.
 
         Returns
         -------
@@ -605,31 +808,24 @@ class InfoExtractionDataset:
             A dictionary containing all computed stats, e.g.
             ``{'num_docs': 384, 'num_annotations': 4353, ...}``.
         """
-        stats = {}
-
-        for stat in self._ALL_STATS:
-            stat_func = getattr(self, stat)
-
-            func_kwargs = {
-                k: kwargs[k]
-                for k in inspect.signature(stat_func).parameters
-                if k in kwargs
-            }
-
-            stats[stat] = stat_func(**func_kwargs)
+        span_cntr, label_cntr, qualifier_cntrs = self._count_freqs(
+            span_callback=span_callback, label_callback=label_callback
+        )
 
-        return stats
+        return {
+            "num_docs": self.num_docs(),
+            "num_annotations": self.num_annotations(),
+            "span_freqs": self._most_common(span_cntr, n_spans),
+            "label_freqs": self._most_common(label_cntr, n_labels),
+            "qualifier_freqs": {
+                name: dict(counts) for name, counts in qualifier_cntrs.items()
+            },
+        }
 
 
 class InfoExtractionMetrics:
     """Calculator for information extraction task metrics."""
 
-    _QUALIFIER_METRICS: ClassVar[dict[str, Callable]] = {
-        "precision": precision_score,
-        "recall": recall_score,
-        "f1": f1_score,
-    }
-
     def __init__(
         self, true: InfoExtractionDataset, pred: InfoExtractionDataset
     ) -> None:
@@ -659,20 +855,28 @@ class InfoExtractionMetrics:
         ValueError
             If the datasets contain documents with non-matching identifiers.
         """
-        if self.true.num_docs() != self.pred.num_docs():
+        true_ids = [doc.identifier for doc in self.true.docs]
+        pred_ids = [doc.identifier for doc in self.pred.docs]
+
+        if len(true_ids) != len(pred_ids):
             msg = "Can only compute metrics for Datasets with same size."
             raise ValueError(msg)
 
-        for true_doc, pred_doc in zip(self.true.docs, self.pred.docs, strict=False):
-            if true_doc.identifier != pred_doc.identifier:
-                msg = (
-                    "Found two documents with non-matching ids "
-                    f"(true={true_doc.identifier}, pred={pred_doc.identifier}). "
-                    "Please make sure to present the same documents, "
-                    "in the same order."
-                )
+        if true_ids != pred_ids:
+            true_id, pred_id = next(
+                (true_id, pred_id)
+                for true_id, pred_id in zip(true_ids, pred_ids, strict=True)
+                if true_id != pred_id
+            )
 
-                raise ValueError(msg)
+            msg = (
+                "Found two documents with non-matching ids "
+                f"(true={true_id}, pred={pred_id}). "
+                "Please make sure to present the same documents, "
+                "in the same order."
+            )
+
+            raise ValueError(msg)
 
     def entity_metrics(
         self,
@@ -702,15 +906,17 @@ class InfoExtractionMetrics:
         ``dict``
             The computed entity metrics.
         """
-        ann_filter = ann_filter or (lambda _: True)
-
-        true_anns = self.true.to_nervaluate(ann_filter)
-        pred_anns = self.pred.to_nervaluate(ann_filter)
+        # Annotations can be passed to nervaluate directly, saving a dict per annotation
+        true_anns = [doc._filter_annotations(ann_filter) for doc in self.true.docs]
+        pred_anns = [doc._filter_annotations(ann_filter) for doc in self.pred.docs]
 
+        # Collect labels from the filtered lists, rather than filtering each doc again
         labels = list(
-            set.union(
-                *[doc.labels(ann_filter) for doc in self.true.docs + self.pred.docs]
-            )
+            {
+                ann.label
+                for doc_anns in itertools.chain(true_anns, pred_anns)
+                for ann in doc_anns
+            }
         )
 
         evaluator = nervaluate.Evaluator(true=true_anns, pred=pred_anns, tags=labels)
@@ -719,7 +925,75 @@ class InfoExtractionMetrics:
 
         return class_results if per_label else results
 
-    def _aggregate_qualifier_values(self) -> dict[str, dict[str, list]]:
+    @staticmethod
+    def _aggregate_doc_qualifier_values(
+        true_doc: Document, pred_doc: Document
+    ) -> dict[str, dict[str, list]]:
+        """
+        Aggregate qualifier values for the true and predicted annotations of a document.
+
+        Parameters
+        ----------
+        true_doc
+            The document containing true annotations.
+        pred_doc
+            The document containing predicted annotations.
+
+        Returns
+        -------
+        ``dict[str, dict[str, list]]``
+            A dictionary containing the aggregated qualifier values of this document,
+            in the same format as ``_aggregate_qualifier_values``.
+        """
+        aggregation: dict = {}
+
+        if not true_doc.annotations or not pred_doc.annotations:
+            return aggregation
+
+        # Index by span once per document, rather than scanning for every annotation.
+        # Reversed, so that the first annotation with a given span is kept
+        pred_annotations = {
+            (annotation.start, annotation.end): annotation
+            for annotation in reversed(pred_doc.annotations)
+        }
+
+        for true_annotation in true_doc.annotations:
+            pred_annotation = pred_annotations.get(
+                (true_annotation.start, true_annotation.end)
+            )
+
+            if pred_annotation is None:
+                continue
+
+            true_qualifiers = true_annotation._get_qualifiers_by_name()
+            pred_qualifiers = pred_annotation._get_qualifiers_by_name()
+
+            for name in true_qualifiers.keys() & pred_qualifiers.keys():
+                true_value = true_qualifiers[name].value
+                pred_value = pred_qualifiers[name].value
+
+                values = aggregation.setdefault(
+                    name, {"true": [], "pred": [], "misses": []}
+                )
+
+                values["true"].append(true_value)
+                values["pred"].append(pred_value)
+
+                if true_value != pred_value:
+                    values["misses"].append(
+                        {
+                            "doc.identifier": true_doc.identifier,
+                            "annotation": true_annotation.to_nervaluate(),
+                            "true_qualifier": true_value,
+                            "pred_qualifier": pred_value,
+                        }
+                    )
+
+        return aggregation
+
+    def _aggregate_qualifier_values(
+        self, n_process: int = 1
+    ) -> dict[str, dict[str, list]]:
         """
         Aggregate qualifier values for true and predicted annotations.
 
@@ -727,6 +1001,12 @@ class InfoExtractionMetrics:
         annotations with the same start and end char in the aggregation. Only includes
         qualifiers that are present in both the true and predicted annotations.
 
+        Parameters
+        ----------
+        n_process
+            The number of processes to aggregate documents with. Documents are
+            aggregated in the current process if set to ``1``.
+
         Returns
         -------
         ``dict[str, dict[str, list]]``
@@ -746,41 +1026,33 @@ class InfoExtractionMetrics:
             }
             ```
         """
-        aggregation: dict = defaultdict(lambda: defaultdict(list))
-
-        for true_doc, pred_doc in zip(self.true.docs, self.pred.docs, strict=False):
-            for true_annotation in true_doc.annotations:
-                pred_annotation = pred_doc.get_annotation_from_span(
-                    start=true_annotation.start, end=true_annotation.end
-                )
-
-                if pred_annotation is None:
-                    continue
-
-                qualifier_names = true_annotation.qualifier_names.intersection(
-                    pred_annotation.qualifier_names
+        aggregate_doc = InfoExtractionMetrics._aggregate_doc_qualifier_values
+
+        if n_process > 1:
+            chunksize = max(1, len(self.true.docs) // (4 * n_process))
+
+            with ProcessPoolExecutor(max_workers=n_process) as executor:
+                doc_aggregations = list(
+                    executor.map(
+                        aggregate_doc,
+                        self.true.docs,
+                        self.pred.docs,
+                        chunksize=chunksize,
+                    )
                 )
+        else:
+            doc_aggregations = map(aggregate_doc, self.true.docs, self.pred.docs)
 
-                for name in qualifier_names:
-                    true_value = true_annotation.get_qualifier_by_name(name).value
-                    pred_value = pred_annotation.get_qualifier_by_name(name).value
-
-                    aggregation[name]["true"].append(true_value)
-                    aggregation[name]["pred"].append(pred_value)
+        aggregation: dict = defaultdict(lambda: defaultdict(list))
 
-                    if true_value != pred_value:
-                        aggregation[name]["misses"].append(
-                            {
-                                "doc.identifier": true_doc.identifier,
-                                "annotation": true_annotation.to_nervaluate(),
-                                "true_qualifier": true_value,
-                                "pred_qualifier": pred_value,
-                            }
-                        )
+        for doc_aggregation in doc_aggregations:
+            for name, values in doc_aggregation.items():
+                for key, value in values.items():
+                    aggregation[name][key].extend(value)
 
         return aggregation
 
-    def qualifier_metrics(self, *, misses: bool = True) -> dict:
+    def qualifier_metrics(self, *, misses: bool = True, n_process: int = 1) -> dict:
         """
         Compute metrics for qualifiers, including precision, recall and f1-score.
 
@@ -788,6 +1060,10 @@ class InfoExtractionMetrics:
         ----------
         misses
             Whether to include all misses (false positives/negatives) in the results.
+        n_process
+            The number of processes to use for matching annotations and aggregating
+            qualifier values. Only worth increasing for large datasets, as documents
+            need to be sent to the worker processes.
 
         Returns
         -------
@@ -799,23 +1075,28 @@ class InfoExtractionMetrics:
         ValueError
             If the datasets contain non-binary qualifier values.
         """
-        aggregation = self._aggregate_qualifier_values()
+        aggregation = self._aggregate_qualifier_values(n_process=n_process)
 
         result = {}
 
         for name, values in aggregation.items():
-            result[name] = {"metrics": {"n": len(values["true"])}}
+            true_values = np.asarray(values["true"])
+            pred_values = np.asarray(values["pred"])
+
+            # Micro-averaged precision, recall and f1-score are all equal to the
+            # fraction of qualifier values that are predicted correctly.
+            score = float(np.mean(true_values == pred_values))
+
+            result[name] = {
+                "metrics": {
+                    "n": len(true_values),
+                    "precision": score,
+                    "recall": score,
+                    "f1": score,
+                }
+            }
 
             if misses:
                 result[name]["misses"] = values["misses"]
 
-            metrics = InfoExtractionMetrics._QUALIFIER_METRICS
-
-            for metric_name, metric_func in metrics.items():
-                metric_result = metric_func(
-                    values["true"], values["pred"], average="micro"
-                )
-
-                result[name]["metrics"][metric_name] = metric_result
-
         return result
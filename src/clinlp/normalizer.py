@@ -1,12 +1,25 @@
 """Component for normalizing text."""
 
+import string
 import unicodedata
+from collections.abc import Callable
 
 from spacy.pipeline import Pipe
 from spacy.tokens import Doc
 
 from clinlp.util import clinlp_component
 
+_NORM_CACHE_SIZE = 2**16
+"""The maximum number of normalized token texts to cache per normalizer."""
+
+_ASCII_FOLD_CACHE: dict[int, str] = {}
+"""Maps non-ascii codepoints to their ascii counterparts, filled on first use."""
+
+_LOWERCASE_ASCII_FOLD_CACHE: dict[int, str] = {
+    ord(char): char.lower() for char in string.ascii_uppercase
+}
+"""Maps codepoints to their lowercased ascii counterparts, filled on first use."""
+
 
 @clinlp_component(
     name="clinlp_normalizer",
@@ -31,8 +44,41 @@ class Normalizer(Pipe):
         map_non_ascii
             Whether to map non ascii characters to ascii counterparts.
         """
-        self.lowercase = lowercase
-        self.map_non_ascii = map_non_ascii
+        self._do_lowercase = lowercase
+        self._do_map_non_ascii = map_non_ascii
+
+        self._transform = self._get_transform()
+        self._norm_cache: dict[int, str] = {}
+
+    @property
+    def lowercase(self) -> bool:
+        """
+        Whether to lowercase text.
+
+        Read-only, as the normalizing function is resolved when the component is
+        created.
+
+        Returns
+        -------
+        ``bool``
+            Whether to lowercase text.
+        """
+        return self._do_lowercase
+
+    @property
+    def map_non_ascii(self) -> bool:
+        """
+        Whether to map non ascii characters to ascii counterparts.
+
+        Read-only, as the normalizing function is resolved when the component is
+        created.
+
+        Returns
+        -------
+        ``bool``
+            Whether to map non ascii characters to ascii counterparts.
+        """
+        return self._do_map_non_ascii
 
     @staticmethod
     def _lowercase(text: str) -> str:
@@ -59,7 +105,7 @@ class Normalizer(Pipe):
         Only handles single characters. Uses NFD normalization to decompose the
         character into its base and diacritic, then encodes the character to ascii,
         ignoring any characters that cannot be encoded. The character is then decoded
-        to utf-8 and returned.
+        back to a string and returned.
 
         Parameters
         ----------
@@ -79,13 +125,12 @@ class Normalizer(Pipe):
         """
         if len(char) != 1:
             msg = (
-                "Please only use the _map_non_ascii_char method "
-                "on strings of length 1."
+                "Please only use the _map_non_ascii_char method on strings of length 1."
             )
             raise ValueError(msg)
 
         normalized_char = unicodedata.normalize("NFD", char)
-        normalized_char = str(normalized_char.encode("ascii", "ignore").decode("utf-8"))
+        normalized_char = normalized_char.encode("ascii", "ignore").decode("ascii")
 
         return normalized_char if len(normalized_char) > 0 else char
 
@@ -105,11 +150,21 @@ class Normalizer(Pipe):
         ``str``
             The text with non-ascii characters mapped to their ascii counterparts.
         """
-        return "".join(self._map_non_ascii_char(char) for char in text)
+        if text.isascii():
+            return text
 
-    def normalize(self, text: str) -> str:
+        for char in set(text):
+            if not char.isascii() and ord(char) not in _ASCII_FOLD_CACHE:
+                _ASCII_FOLD_CACHE[ord(char)] = self._map_non_ascii_char(char)
+
+        return text.translate(_ASCII_FOLD_CACHE)
+
+    def _lowercase_and_map_non_ascii(self, text: str) -> str:
         """
-        Normalize text, based on the component's settings.
+        Lowercase text, and map non-ascii characters to their ascii counterparts.
+
+        Ascii text only needs lowercasing, which is the same as casefolding for ascii.
+        Other text is lowercased and mapped in a single ``str.translate`` pass.
 
         Parameters
         ----------
@@ -121,13 +176,72 @@ class Normalizer(Pipe):
         ``str``
             The normalized text.
         """
+        if text.isascii():
+            return text.lower()
+
+        # Casefolding works per character, so both steps fuse into a single table
+        for char in set(text):
+            if not char.isascii() and ord(char) not in _LOWERCASE_ASCII_FOLD_CACHE:
+                _LOWERCASE_ASCII_FOLD_CACHE[ord(char)] = self._map_non_ascii_string(
+                    self._lowercase(char)
+                )
+
+        return text.translate(_LOWERCASE_ASCII_FOLD_CACHE)
+
+    @staticmethod
+    def _identity(text: str) -> str:
+        """
+        Return text as is.
+
+        Parameters
+        ----------
+        text
+            The text.
+
+        Returns
+        -------
+        ``str``
+            The same text.
+        """
+        return text
+
+    def _get_transform(self) -> Callable[[str], str]:
+        """
+        Get the function that normalizes text, based on the component's settings.
+
+        Resolving the settings once keeps them out of the per-token loop.
+
+        Returns
+        -------
+        ``Callable[[str], str]``
+            The function that normalizes text.
+        """
+        if self.lowercase and self.map_non_ascii:
+            return self._lowercase_and_map_non_ascii
+
         if self.lowercase:
-            text = self._lowercase(text)
+            return self._lowercase
 
         if self.map_non_ascii:
-            text = self._map_non_ascii_string(text)
+            return self._map_non_ascii_string
 
-        return text
+        return self._identity
+
+    def normalize(self, text: str) -> str:
+        """
+        Normalize text, based on the component's settings.
+
+        Parameters
+        ----------
+        text
+            The text to normalize.
+
+        Returns
+        -------
+        ``str``
+            The normalized text.
+        """
+        return self._transform(text)
 
     def __call__(self, doc: Doc) -> Doc:
         """
@@ -146,7 +260,19 @@ class Normalizer(Pipe):
         if len(doc) == 0:
             return doc
 
+        transform = self._transform
+        norm_cache = self._norm_cache
+
+        # Cached by orth (the hash of the text), so cache hits need no token.text
         for token in doc:
-            token.norm_ = self.normalize(token.text)
+            norm = norm_cache.get(token.orth)
+
+            if norm is None:
+                norm = transform(token.text)
+
+                if len(norm_cache) < _NORM_CACHE_SIZE:
+                    norm_cache[token.orth] = norm
+
+            token.norm_ = norm
 
         return doc
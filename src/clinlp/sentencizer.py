@@ -1,10 +1,15 @@
 """Component for sentencizing text."""
 
+import numpy as np
+from spacy.attrs import SENT_START
 from spacy.pipeline import Pipe
 from spacy.tokens import Doc, Token
 
 from clinlp.util import clinlp_component
 
+_BOUNDARY_CACHE_SIZE = 2**16
+"""The maximum number of token texts to cache sentence boundary flags for."""
+
 
 @clinlp_component(
     name="clinlp_sentencizer", assigns=["token.is_sent_start", "doc.sents"]
@@ -40,6 +45,8 @@ class Sentencizer(Pipe):
         self.sent_end_chars = set(sent_end_chars)
         self.sent_start_punct = set(sent_start_punct)
 
+        self._boundary_cache: dict[int, tuple[bool, bool]] = {}
+
     def _token_can_start_sent(self, token: Token) -> bool:
         """
         Determine whether a token can start a sentence.
@@ -54,11 +61,9 @@ class Sentencizer(Pipe):
         ``bool``
             Whether the token can start a sentence.
         """
-        return (
-            token.text[0].isalnum()
-            or (token.text[0] in {"["})
-            or (token.text in self.sent_start_punct)
-        )
+        text = token.text
+
+        return text[0].isalnum() or text[0] == "[" or text in self.sent_start_punct
 
     def _token_can_end_sent(self, token: Token) -> bool:
         """
@@ -96,17 +101,35 @@ class Sentencizer(Pipe):
 
         sentence_starts = [False] * len(doc)
 
-        if self._token_can_start_sent(doc[0]):
-            sentence_starts[0] = True
+        # Same logic as _token_can_start_sent and _token_can_end_sent, inlined as
+        # this loop runs for every token. The outcome only depends on the token
+        # text, so it is cached by orth (the hash of the text).
+        sent_start_punct = self.sent_start_punct
+        sent_end_chars = self.sent_end_chars
+        boundary_cache = self._boundary_cache
 
         seen_end_char = True
 
         for i, token in enumerate(doc):
-            if seen_end_char and self._token_can_start_sent(token):
+            boundaries = boundary_cache.get(token.orth)
+
+            if boundaries is None:
+                text = token.text
+                boundaries = (
+                    text[0].isalnum() or text[0] == "[" or text in sent_start_punct,
+                    text in sent_end_chars,
+                )
+
+                if len(boundary_cache) < _BOUNDARY_CACHE_SIZE:
+                    boundary_cache[token.orth] = boundaries
+
+            can_start_sent, can_end_sent = boundaries
+
+            if seen_end_char and can_start_sent:
                 sentence_starts[i] = True
                 seen_end_char = False
 
-            if self._token_can_end_sent(token):
+            if can_end_sent:
                 seen_end_char = True
 
         return sentence_starts
@@ -129,9 +152,10 @@ class Sentencizer(Pipe):
         if len(doc) == 0:
             return doc
 
-        sentence_starts = self._compute_sentence_starts(doc)
+        sentence_starts = np.where(self._compute_sentence_starts(doc), 1, -1)
 
-        for is_sent_start, token in zip(sentence_starts, doc, strict=True):
-            token.is_sent_start = is_sent_start
+        # Setting token.is_sent_start per token rechecks the whole doc each time,
+        # so set all sentence starts in one go instead
+        doc.from_array([SENT_START], sentence_starts.astype("uint64").reshape(-1, 1))
 
         return doc
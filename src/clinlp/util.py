@@ -1,10 +1,10 @@
 """Utility functions that are used throughout the library."""
 
+import functools
 import inspect
 from collections.abc import Callable
 from inspect import Parameter, Signature
 
-from makefun import with_signature
 from spacy.language import Language
 
 
@@ -16,7 +16,8 @@ def get_class_init_signature(cls: type) -> tuple[list, dict]:
     """
     Get the arguments and defaults of a class's ``__init__`` method.
 
-    Handles inheritance.
+    Handles inheritance. The signature is only inspected once per class, callers
+    receive copies that can safely be modified.
 
     Parameters
     ----------
@@ -30,6 +31,29 @@ def get_class_init_signature(cls: type) -> tuple[list, dict]:
     ``dict``
         A mapping of arguments to their defaults, for those arguments that have one.
     """
+    args, defaults = _get_class_init_signature(cls)
+
+    return list(args), dict(defaults)
+
+
+@functools.cache
+def _get_class_init_signature(cls: type) -> tuple[tuple, dict]:
+    """
+    Inspect the arguments and defaults of a class's ``__init__`` method.
+
+    Parameters
+    ----------
+    cls
+        The class to get the signature of.
+
+    Returns
+    -------
+    ``tuple``
+        The arguments of the class's ``__init__`` method.
+    ``dict``
+        A mapping of arguments to their defaults, for those arguments that have one.
+        Should not be modified, as it is cached.
+    """
     args = []
     defaults = {}
 
@@ -53,7 +77,7 @@ def get_class_init_signature(cls: type) -> tuple[list, dict]:
             if argspec.kwonlydefaults is not None:
                 defaults |= argspec.kwonlydefaults
 
-    return args, defaults
+    return tuple(args), defaults
 
 
 def clinlp_component(*args, **kwargs) -> Callable:
@@ -89,7 +113,6 @@ def clinlp_component(*args, **kwargs) -> Callable:
             for arg in make_component_args
         ]
 
-        @with_signature(Signature(params), func_name="make_component")
         def make_component(*args, **kwargs) -> type:
             if len(args) > 0:
                 msg = "Please pass all arguments as keywords."
@@ -103,6 +126,9 @@ def clinlp_component(*args, **kwargs) -> Callable:
 
             return cls(**cls_kwargs)
 
+        # spaCy inspects the signature to find the arguments of the factory
+        make_component.__signature__ = Signature(params)
+
         Language.factory(
             *args, func=make_component, default_config=component_defaults, **kwargs
         )
@@ -1,11 +1,16 @@
 """Controller for the Information Extraction demo."""
 
-import pickle
+import functools
 
 import spacy
-from dash import Input, Output, State, callback, html
+from dash import Input, Output, State, callback, clientside_callback, html
 
-from clinlp_apps.ie_demo.src.model import check_overlapping_entities, get_model
+from clinlp_apps.ie_demo.src.model import (
+    check_overlapping_entities,
+    deserialize_doc,
+    get_model,
+    serialize_doc,
+)
 from clinlp_apps.ie_demo.src.utils import simple_label
 from clinlp_apps.ie_demo.src.view import (
     format_entity,
@@ -18,6 +23,7 @@ from clinlp_apps.ie_demo.src.view import (
 OVERLAP_ERROR = "⚠️ Cannot visualize overlapping entities, please modify input."
 NON_QUALIFIED_BGCOLOR = "#e6ffe6"
 QUALIFIED_BGCOLOR = "#ffe6e6"
+TEXT_INPUT_DEBOUNCE_MS = 250
 
 
 nlp = get_model()
@@ -36,13 +42,7 @@ def tokens(doc: spacy.language.Doc) -> list[html.Span]:
     -------
         The visual output for the tokens tab.
     """
-    output = []
-
-    for token in doc:
-        output.append(format_token(token.text))
-        output.append(whitespace)
-
-    return output
+    return [span for token in doc for span in (format_token(token.text), whitespace)]
 
 
 def normalized(doc: spacy.language.Doc) -> list[html.Span]:
@@ -58,13 +58,7 @@ def normalized(doc: spacy.language.Doc) -> list[html.Span]:
     -------
         The visual output for the normalizer tab.
     """
-    output = []
-
-    for token in doc:
-        output.append(format_token(token.norm_))
-        output.append(whitespace)
-
-    return output
+    return [span for token in doc for span in (format_token(token.norm_), whitespace)]
 
 
 def sentences(doc: spacy.language.Doc) -> list[html.Span]:
@@ -89,6 +83,36 @@ def sentences(doc: spacy.language.Doc) -> list[html.Span]:
     return output
 
 
+def token_range_text(doc: spacy.language.Doc, text: str, start: int, end: int) -> str:
+    """
+    Get the text of a range of tokens, like ``doc[start:end].text``.
+
+    Slices the document text directly, rather than building the text from a
+    ``Span``.
+
+    Parameters
+    ----------
+    doc
+        The input document.
+    text
+        The text of the input document.
+    start
+        The index of the first token.
+    end
+        The index after the last token.
+
+    Returns
+    -------
+        The text of the tokens, without trailing whitespace.
+    """
+    if start >= end:
+        return ""
+
+    last_token = doc[end - 1]
+
+    return text[doc[start].idx : last_token.idx + len(last_token)]
+
+
 def entities(doc: spacy.language.Doc) -> list[html.Span]:
     """
     Produce visual output for the entities tab.
@@ -106,14 +130,19 @@ def entities(doc: spacy.language.Doc) -> list[html.Span]:
         return [html.Span(OVERLAP_ERROR)]
 
     output = []
+    text = doc.text
     i = 0
 
     for ent in doc.spans["ents"]:
-        output.extend(format_text(doc[i : ent.start].text))
-        output.append(format_entity(ent.text, sub_label=simple_label(ent.label_)))
+        output.extend(format_text(token_range_text(doc, text, i, ent.start)))
+        output.append(
+            format_entity(
+                text[ent.start_char : ent.end_char], sub_label=simple_label(ent.label_)
+            )
+        )
         i = ent.end
 
-    output.extend(format_text(doc[i:].text))
+    output.extend(format_text(token_range_text(doc, text, i, len(doc))))
 
     return output
 
@@ -135,15 +164,16 @@ def qualifiers(doc: spacy.language.Doc) -> list[html.Span]:
         return [html.Span(OVERLAP_ERROR)]
 
     output = []
+    text = doc.text
     i = 0
 
     for ent in doc.spans["ents"]:
-        output.extend(format_text(doc[i : ent.start].text))
+        output.extend(format_text(token_range_text(doc, text, i, ent.start)))
 
         q_label = ",".join(q.value for q in ent._.qualifiers if not q.is_default)
 
         entity = {
-            "text": ent.text,
+            "text": text[ent.start_char : ent.end_char],
             "sub_label": simple_label(ent.label_),
         }
 
@@ -159,11 +189,51 @@ def qualifiers(doc: spacy.language.Doc) -> list[html.Span]:
         output.append(format_entity(**entity))
         i = ent.end
 
-    output.extend(format_text(doc[i:].text))
+    output.extend(format_text(token_range_text(doc, text, i, len(doc))))
 
     return output
 
 
+@functools.lru_cache(maxsize=64)
+def _process(text: str) -> dict[str, str]:
+    """
+    Process text and serialize the resulting doc object.
+
+    Cached, so that retyping a previous input does not rerun the pipeline.
+
+    Parameters
+    ----------
+    text
+        The input text.
+
+    Returns
+    -------
+        A serialized doc object.
+    """
+    return serialize_doc(nlp(text))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_doc(doc: str, user_data: str) -> spacy.language.Doc:
+    """
+    Deserialize a stored doc object.
+
+    Cached, so that switching between tabs reuses the same doc object.
+
+    Parameters
+    ----------
+    doc
+        The serialized doc.
+    user_data
+        The serialized user data of the doc.
+
+    Returns
+    -------
+        The doc object.
+    """
+    return deserialize_doc({"doc": doc, "user_data": user_data}, nlp.vocab)
+
+
 @callback(
     Output("output-text-area", "children"),
     State("doc", "data"),
@@ -171,7 +241,7 @@ def qualifiers(doc: spacy.language.Doc) -> list[html.Span]:
     Input("doc", "modified_timestamp"),
     prevent_initial_call=True,
 )
-def render_tab(doc_data: list[str], tab: str, _: str) -> list[html.Span]:
+def render_tab(doc_data: dict[str, str], tab: str, _: str) -> list[html.Span]:
     """
     Render the visual output for the selected tab.
 
@@ -186,7 +256,7 @@ def render_tab(doc_data: list[str], tab: str, _: str) -> list[html.Span]:
     -------
         The visual output for the selected tab.
     """
-    doc = pickle.loads(doc_data.encode("latin1"))  # noqa S301
+    doc = _load_doc(**doc_data)
 
     renderers = {
         "qualifiers": qualifiers,
@@ -199,11 +269,27 @@ def render_tab(doc_data: list[str], tab: str, _: str) -> list[html.Span]:
     return renderers[tab](doc)
 
 
+clientside_callback(
+    f"""
+    function(value) {{
+        clearTimeout(window.textInputDebounceTimer);
+        window.textInputDebounceTimer = setTimeout(function() {{
+            dash_clientside.set_props("text-input-debounced", {{data: value}});
+        }}, {TEXT_INPUT_DEBOUNCE_MS});
+        return dash_clientside.no_update;
+    }}
+    """,
+    Output("text-input-debounced", "data"),
+    Input("text-input", "value"),
+    prevent_initial_call=True,
+)
+
+
 @callback(
     Output("doc", "data"),
-    Input("text-input", "value"),
+    Input("text-input-debounced", "data"),
 )
-def process_text(text: str) -> list[str]:
+def process_text(text: str) -> dict[str, str]:
     """
     Process the changed input and store doc object.
 
@@ -216,6 +302,4 @@ def process_text(text: str) -> list[str]:
     -------
         A serialized doc object for storage.
     """
-    doc = nlp(text)
-
-    return pickle.dumps(doc).decode("latin1")
+    return _process(text)
@@ -1,9 +1,13 @@
 """Model for the Information Extraction demo."""
 
+import base64
 import itertools
+import pickle
 
 import spacy
 from spacy.language import Language
+from spacy.tokens import Doc
+from spacy.vocab import Vocab
 
 import clinlp  # noqa: F401
 from clinlp_apps.ie_demo.src.utils import RESOURCE_PATH
@@ -56,3 +60,49 @@ def check_overlapping_entities(doc: spacy.language.Doc) -> bool:
     ents = sorted(doc.spans["ents"], key=lambda ent: ent.start)
 
     return any(ent2.start <= ent1.end for ent1, ent2 in itertools.pairwise(ents))
+
+
+def serialize_doc(doc: Doc) -> dict[str, str]:
+    """
+    Serialize a document for storage.
+
+    Uses ``spaCy`` serialization for the document itself, which unlike pickling
+    the document does not include the entire vocab. Only the user data, which holds
+    the qualifiers, is pickled.
+
+    Parameters
+    ----------
+    doc
+        The document to serialize.
+
+    Returns
+    -------
+        The serialized document.
+    """
+    return {
+        "doc": base64.b64encode(doc.to_bytes(exclude=["tensor", "user_data"])).decode(
+            "ascii"
+        ),
+        "user_data": base64.b64encode(pickle.dumps(doc.user_data)).decode("ascii"),
+    }
+
+
+def deserialize_doc(doc_data: dict[str, str], vocab: Vocab) -> Doc:
+    """
+    Deserialize a stored document.
+
+    Parameters
+    ----------
+    doc_data
+        The serialized document, as created by ``serialize_doc``.
+    vocab
+        The vocab of the model that created the document.
+
+    Returns
+    -------
+        The deserialized document.
+    """
+    doc = Doc(vocab).from_bytes(base64.b64decode(doc_data["doc"]))
+    doc.user_data = pickle.loads(base64.b64decode(doc_data["user_data"]))  # noqa: S301
+
+    return doc
@@ -1,9 +1,14 @@
 """Utility functions for the Information Extraction demo."""
 
 import importlib
+import string
 
 RESOURCE_PATH = importlib.resources.files("clinlp_apps.ie_demo.resources")
 
+SIMPLE_LABEL_TABLE = str.maketrans(
+    string.ascii_uppercase + " ", string.ascii_lowercase + "_"
+)
+
 
 def simple_label(label: str) -> str:
     """
@@ -18,4 +23,8 @@ def simple_label(label: str) -> str:
     -------
         The simple label.
     """
+    # Lowercasing and replacing spaces in one pass only works for ascii
+    if label.isascii():
+        return label.translate(SIMPLE_LABEL_TABLE)
+
     return label.lower().replace(" ", "_")
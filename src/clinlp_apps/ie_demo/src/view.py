@@ -1,6 +1,6 @@
 """Views for the Information Extraction demo."""
 
-import re
+import functools
 
 import dash_bootstrap_components as dbc
 from dash import dcc, html
@@ -19,14 +19,17 @@ TOKEN_STYLE = {
     "border-radius": "8px",
 }
 
+ENTITY_TEXT_STYLE = {"font-weight": "bold"}
+
+LABEL_WRAPPER_STYLE = {"display": "inline-block", "margin-left": "4px"}
+
 SENTENCE_MARKER_SYMBOL = "»"
 NEWLINE_SYMBOL = "⏎"
 WHITESPACE_SYMBOL = "⌴"
 
 SAMPLE_TEXT_FILE = RESOURCE_PATH / "sample_text.txt"
 
-with SAMPLE_TEXT_FILE.open() as file:
-    SAMPLE_TEXT = file.read()
+SAMPLE_TEXT = SAMPLE_TEXT_FILE.read_text(encoding="utf-8")
 
 
 text_area = html.Div(
@@ -40,6 +43,7 @@ text_area = html.Div(
 )
 
 content = [
+    dcc.Store(id="text-input-debounced", data=SAMPLE_TEXT),
     dcc.Store(id="doc"),
     html.H1("Clinlp Information Extraction Demo"),
     html.Span(f"clinlp v{clinlp.__version__}"),
@@ -90,7 +94,8 @@ def format_text(text: str) -> list[html.Span]:
     """
     output = []
 
-    lines = re.split(r"\n|\r", text)
+    # Same as splitting on either \n or \r, but without a regex
+    lines = text.replace("\r", "\n").split("\n")
 
     for i, line in enumerate(lines):
         output.append(line)
@@ -126,6 +131,55 @@ def format_token(text: str) -> html.Span:
     )
 
 
+@functools.cache
+def get_entity_style(bg_color: str) -> dict:
+    """
+    Get the style of an entity.
+
+    Cached, as only a few colors are used. The style should not be modified.
+
+    Parameters
+    ----------
+    bg_color
+        The background color.
+
+    Returns
+    -------
+        The entity style.
+    """
+    return {
+        "background-color": bg_color,
+        "padding": "6px",
+        "margin": "2px",
+        "border-radius": "8px",
+    }
+
+
+@functools.cache
+def get_label_style(label_text_color: str) -> dict:
+    """
+    Get the style of an entity label.
+
+    Cached, as only a few colors are used. The style should not be modified.
+
+    Parameters
+    ----------
+    label_text_color
+        The label text color.
+
+    Returns
+    -------
+        The label style.
+    """
+    return {
+        "color": label_text_color,
+        "position": "relative",
+        "display": "block",
+        "font-size": "0.8em",
+        "line-height": 1.2,
+    }
+
+
 def format_entity(
     text: str,
     sub_label: str | None = None,
@@ -155,25 +209,10 @@ def format_entity(
     -------
         The formatted entity.
     """
-    entity_style = {
-        "background-color": bg_color,
-        "padding": "6px",
-        "margin": "2px",
-        "border-radius": "8px",
-    }
-
-    entity_text_style = {"font-weight": "bold"}
-
-    label_style = {
-        "color": label_text_color,
-        "position": "relative",
-        "display": "block",
-        "font-size": "0.8em",
-        "line-height": 1.2,
-    }
+    label_style = get_label_style(label_text_color)
 
     entity = [
-        html.Span(text, style=entity_text_style),
+        html.Span(text, style=ENTITY_TEXT_STYLE),
     ]
 
     if sup_label or sub_label:
@@ -195,13 +234,9 @@ def format_entity(
                 )
             )
 
-        entity.append(
-            html.Span(
-                label_spans, style={"display": "inline-block", "margin-left": "4px"}
-            )
-        )
+        entity.append(html.Span(label_spans, style=LABEL_WRAPPER_STYLE))
 
     return html.Span(
         entity,
-        style=entity_style,
+        style=get_entity_style(bg_color),
     )
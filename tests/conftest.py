@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 
 import pytest
@@ -6,6 +7,7 @@ from spacy import Language
 
 import clinlp  # noqa F401
 from clinlp.ie import SPANS_KEY
+from clinlp.language import Clinlp
 
 TEST_DATA_DIR = Path("tests/test_data")
 
@@ -13,6 +15,7 @@ TEST_DATA_DIR = Path("tests/test_data")
 class MockToken:
     def __init__(self, text: str):
         self.text = text
+        self.orth = hash(text)
         self.is_sent_start = False
 
 
@@ -20,10 +23,18 @@ def get_mock_tokens(texts: list[str]):
     return [MockToken(text) for text in texts]
 
 
-def _make_nlp():
+@functools.cache
+def _make_base_nlp():
     return spacy.blank("clinlp")
 
 
+def _make_nlp():
+    # Building the tokenizer is slow, so share it (and the vocab) across pipelines
+    base_nlp = _make_base_nlp()
+
+    return Clinlp(vocab=base_nlp.vocab, create_tokenizer=lambda _: base_nlp.tokenizer)
+
+
 def _make_nlp_entity(nlp: Language):
     nlp.add_pipe("clinlp_normalizer")
 
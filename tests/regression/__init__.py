@@ -1,34 +1,49 @@
-import json
+import functools
 from collections.abc import Collection
 from pathlib import Path
 
+import orjson
 import pytest
+from spacy.language import Language
+from spacy.tokens import Doc
 
 from clinlp.metrics import InfoExtractionDataset
 
 
 def load_examples(filename: str) -> list[dict]:
-    with Path(filename).open("rb") as file:
-        return json.load(file)["examples"]
+    return orjson.loads(Path(filename).read_bytes())["examples"]
+
+
+@functools.cache
+def _load_qualifier_dataset(filename: str) -> InfoExtractionDataset:
+    # Shared by all qualifier regression modules, so only read the file once
+    return InfoExtractionDataset.read_json(filename)
 
 
 def load_qualifier_examples(
-    filename: str, failures=Collection[int]
+    filename: str, failures: Collection[str]
 ) -> list["pytest.param"]:
-    ied = InfoExtractionDataset.read_json(filename)
+    ied = _load_qualifier_dataset(filename)
 
     examples_as_param = []
 
     for doc in ied.docs:
-        marks = pytest.mark.xfail if doc.identifier in failures else []
+        marks = (pytest.mark.xfail,) if doc.identifier in failures else ()
 
         examples_as_param.append(
             pytest.param(
                 doc.text,
                 doc.annotations[0],
+                frozenset(doc.annotations[0].qualifiers),
                 id=f"qualifier_case_{doc.identifier}",
                 marks=marks,
             )
         )
 
     return examples_as_param
+
+
+def process_examples(nlp: Language, examples: list["pytest.param"]) -> dict[str, Doc]:
+    texts = [example.values[0] for example in examples]
+
+    return dict(zip(texts, nlp.pipe(texts), strict=True))
@@ -1,6 +1,6 @@
 import pytest
 from tests.conftest import _make_nlp, _make_nlp_entity
-from tests.regression import load_qualifier_examples
+from tests.regression import load_qualifier_examples, process_examples
 
 from clinlp.ie import SPANS_KEY
 from clinlp.ie.qualifier.qualifier import ATTR_QUALIFIERS
@@ -34,11 +34,20 @@ def nlp_qualifier(nlp_entity):
     return nlp_entity
 
 
+# Arrange
+@pytest.fixture(scope="class")
+def docs(nlp_qualifier):
+    return process_examples(nlp_qualifier, examples)
+
+
+@pytest.mark.xdist_group("regression_context_algorithm")
 class TestRegressionContextAlgorithm:
-    @pytest.mark.parametrize(("text", "expected_ent"), examples)
-    def test_regression_context_algorithm(self, nlp_qualifier, text, expected_ent):
+    @pytest.mark.parametrize(("text", "expected_ent", "expected_qualifiers"), examples)
+    def test_regression_context_algorithm(
+        self, docs, text, expected_ent, expected_qualifiers
+    ):
         # Act
-        doc = nlp_qualifier(text)
+        doc = docs[text]
 
         # Assert
         assert len(doc.spans[SPANS_KEY]) == 1
@@ -46,5 +55,5 @@ class TestRegressionContextAlgorithm:
         assert doc.spans[SPANS_KEY][0].start == expected_ent.start
         assert doc.spans[SPANS_KEY][0].end == expected_ent.end
         assert getattr(doc.spans[SPANS_KEY][0]._, ATTR_QUALIFIERS).issubset(
-            set(expected_ent.qualifiers)
+            expected_qualifiers
         )
@@ -1,6 +1,6 @@
 import pytest
 from tests.conftest import _make_nlp, _make_nlp_entity
-from tests.regression import load_qualifier_examples
+from tests.regression import load_qualifier_examples, process_examples
 
 from clinlp.ie import SPANS_KEY
 from clinlp.ie.qualifier.qualifier import ATTR_QUALIFIERS
@@ -65,13 +65,28 @@ def nlp_qualifier_experiencer(nlp_entity):
     return nlp_entity
 
 
+# Arrange
+@pytest.fixture(scope="class")
+def docs_negation(nlp_qualifier_negation):
+    return process_examples(nlp_qualifier_negation, examples["negation"])
+
+
+# Arrange
+@pytest.fixture(scope="class")
+def docs_experiencer(nlp_qualifier_experiencer):
+    return process_examples(nlp_qualifier_experiencer, examples["experiencer"])
+
+
+@pytest.mark.xdist_group("regression_negation_transformer")
 class TestRegressionNegationTransformer:
-    @pytest.mark.parametrize(("text", "expected_ent"), examples["negation"])
+    @pytest.mark.parametrize(
+        ("text", "expected_ent", "expected_qualifiers"), examples["negation"]
+    )
     def test_regression_negation_transformer(
-        self, nlp_qualifier_negation, text, expected_ent
+        self, docs_negation, text, expected_ent, expected_qualifiers
     ):
         # Act
-        doc = nlp_qualifier_negation(text)
+        doc = docs_negation[text]
 
         # Assert
         assert len(doc.spans[SPANS_KEY]) == 1
@@ -79,24 +94,26 @@ class TestRegressionNegationTransformer:
         assert doc.spans[SPANS_KEY][0].start == expected_ent.start
         assert doc.spans[SPANS_KEY][0].end == expected_ent.end
         assert getattr(doc.spans[SPANS_KEY][0]._, ATTR_QUALIFIERS).issubset(
-            set(expected_ent.qualifiers)
+            expected_qualifiers
         )
 
 
+@pytest.mark.xdist_group("regression_experiencer_transformer")
 class TestRegressionExperiencerTransformer:
-    @pytest.mark.parametrize(("text", "expected_ent"), examples["experiencer"])
+    @pytest.mark.parametrize(
+        ("text", "expected_ent", "expected_qualifiers"), examples["experiencer"]
+    )
     def test_regression_experiencer_transformer(
-        self, nlp_qualifier_experiencer, text, expected_ent
+        self, docs_experiencer, text, expected_ent, expected_qualifiers
     ):
         # Act
-        doc = nlp_qualifier_experiencer(text)
+        doc = docs_experiencer[text]
 
-        # Assert
         # Assert
         assert len(doc.spans[SPANS_KEY]) == 1
         assert str(doc.spans[SPANS_KEY][0]) == expected_ent.text
         assert doc.spans[SPANS_KEY][0].start == expected_ent.start
         assert doc.spans[SPANS_KEY][0].end == expected_ent.end
         assert getattr(doc.spans[SPANS_KEY][0]._, ATTR_QUALIFIERS).issubset(
-            set(expected_ent.qualifiers)
+            expected_qualifiers
         )
@@ -5,7 +5,11 @@ from tests.conftest import get_mock_tokens
 from tests.regression import load_examples
 
 sentencizer_cases = [
-    pytest.param(example["tokens"], example["sentence_starts"], id="sentencizer_case_")
+    pytest.param(
+        get_mock_tokens(example["tokens"]),
+        example["sentence_starts"],
+        id="sentencizer_case_",
+    )
     for example in load_examples("data/sentencizer_cases.json")
 ]
 
@@ -21,9 +25,6 @@ class TestClinlpSentencizerRegression:
     def test_regression_sentencizer(
         self, sentencizer, tokens, expected_sentence_starts
     ):
-        # Arrange
-        tokens = get_mock_tokens(tokens)
-
         # Act
         sentence_starts = sentencizer._compute_sentence_starts(tokens)
 
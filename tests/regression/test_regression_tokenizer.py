@@ -20,11 +20,22 @@ def tokenizer(nlp):
     return nlp.tokenizer
 
 
+# Arrange
+@pytest.fixture(scope="class")
+def tokens_by_text(tokenizer):
+    texts = [case.values[0] for case in tokenizer_cases]
+
+    return {
+        text: [token.text for token in doc]
+        for text, doc in zip(texts, tokenizer.pipe(texts), strict=True)
+    }
+
+
 class TestTokenizerRegression:
     @pytest.mark.parametrize(("text", "expected_tokens"), tokenizer_cases)
-    def test_regression_tokenizer(self, tokenizer, text, expected_tokens):
+    def test_regression_tokenizer(self, tokens_by_text, text, expected_tokens):
         # Act
-        tokens = [token.text for token in tokenizer(text)]
+        tokens = tokens_by_text[text]
 
         # Assert
         assert tokens == expected_tokens
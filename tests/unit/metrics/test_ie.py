@@ -73,6 +73,26 @@ class TestAnnotation:
         # Assert
         assert ann == Annotation(text="test", start=1, end=5, label="test")
 
+    def test_annotation_strip_text_shorter_than_span(self):
+        # Arrange
+        ann = Annotation(text=" x", start=0, end=5, label="test")
+
+        # Act
+        ann.strip()
+
+        # Assert
+        assert ann == Annotation(text="x", start=1, end=5, label="test")
+
+    def test_annotation_strip_only_punctuation(self):
+        # Arrange
+        ann = Annotation(text=" , ", start=10, end=13, label="test")
+
+        # Act
+        ann.strip()
+
+        # Assert
+        assert ann == Annotation(text="", start=13, end=13, label="test")
+
     def test_annotation_to_nervaluate(self):
         # Arrange
         ann = Annotation(text="test", start=0, end=5, label="test")
@@ -88,6 +108,39 @@ class TestAnnotation:
             "label": "test",
         }
 
+    def test_annotation_getitem(self):
+        # Arrange
+        ann = Annotation(text="test", start=0, end=5, label="test")
+
+        # Act
+        items = {key: ann[key] for key in ("text", "start", "end", "label")}
+
+        # Assert
+        assert items == ann.to_nervaluate()
+
+    def test_annotation_getitem_unknown_key(self):
+        # Arrange
+        ann = Annotation(text="test", start=0, end=5, label="test")
+
+        # Assert
+        with pytest.raises(KeyError):
+            # Act
+            _ = ann["qualifiers"]
+
+    def test_annotation_mapping(self):
+        # Arrange
+        ann = Annotation(text="test", start=0, end=5, label="test")
+
+        # Act
+        items = dict(ann)
+
+        # Assert
+        assert items == ann.to_nervaluate()
+        assert list(ann) == ["text", "start", "end", "label"]
+        assert len(ann) == 4
+        assert "text" in ann
+        assert "qualifiers" not in ann
+
     def test_annotation_to_dict(self):
         # Arrange
         ann = Annotation(
@@ -135,6 +188,23 @@ class TestAnnotation:
         # Assert
         assert qualifier_names == {"Negation", "Experiencer"}
 
+    def test_annotation_qualifier_names_after_mutation(self):
+        # Arrange
+        ann = Annotation(
+            text="test",
+            start=0,
+            end=4,
+            label="test",
+            qualifiers=[Qualifier(name="Negation", value="Affirmed")],
+        )
+        _ = ann.qualifier_names
+
+        # Act
+        ann.qualifiers.append(Qualifier(name="Experiencer", value="Other"))
+
+        # Assert
+        assert ann.qualifier_names == {"Negation", "Experiencer"}
+
     def test_annotation_get_qualifier_by_name(self):
         # Arrange
         q1 = Qualifier(name="Negation", value="Affirmed")
@@ -147,6 +217,34 @@ class TestAnnotation:
         # Assert
         assert qualifier == q2
 
+    def test_annotation_get_qualifier_by_name_after_mutation(self):
+        # Arrange
+        q1 = Qualifier(name="Negation", value="Affirmed")
+        q2 = Qualifier(name="Experiencer", value="Other")
+        q3 = Qualifier(name="Negation", value="Negated")
+        ann = Annotation(text="test", start=0, end=4, label="test", qualifiers=[q1])
+        _ = ann.get_qualifier_by_name(qualifier_name="Negation")
+
+        # Act
+        ann.qualifiers.append(q2)
+        experiencer = ann.get_qualifier_by_name(qualifier_name="Experiencer")
+        ann.qualifiers = [q3]
+        negation = ann.get_qualifier_by_name(qualifier_name="Negation")
+
+        # Assert
+        assert experiencer == q2
+        assert negation == q3
+
+    def test_annotation_get_qualifier_by_name_missing(self):
+        # Arrange
+        q1 = Qualifier(name="Negation", value="Affirmed")
+        ann = Annotation(text="test", start=0, end=4, label="test", qualifiers=[q1])
+
+        # Assert
+        with pytest.raises(KeyError, match=".*No qualifier with name Experiencer.*"):
+            # Act
+            ann.get_qualifier_by_name(qualifier_name="Experiencer")
+
 
 class TestDocument:
     def test_document_to_nervaluate(self):
@@ -227,6 +325,40 @@ class TestDocument:
         # Assert
         assert labels == {"test1", "test2"}
 
+    def test_document_labels_returns_copy(self):
+        # Arrange
+        doc = Document(
+            identifier="1",
+            text="test1 and test2",
+            annotations=[
+                Annotation(text="test1", start=0, end=5, label="test1"),
+                Annotation(text="test2", start=10, end=15, label="test2"),
+            ],
+        )
+
+        # Act
+        doc.labels().add("test3")
+
+        # Assert
+        assert doc.labels() == {"test1", "test2"}
+
+    def test_document_labels_after_mutation(self):
+        # Arrange
+        doc = Document(
+            identifier="1",
+            text="test1 and test2",
+            annotations=[Annotation(text="test1", start=0, end=5, label="test1")],
+        )
+        _ = doc.labels()
+
+        # Act
+        doc.annotations.append(
+            Annotation(text="test2", start=10, end=15, label="test2")
+        )
+
+        # Assert
+        assert doc.labels() == {"test1", "test2"}
+
     def test_document_labels_with_filter(self):
         # Arrange
         doc = Document(
@@ -490,6 +622,17 @@ class TestDataset:
             ],
         }
 
+    def test_dataset_write_read_json(self, mctrainer_dataset, tmp_path):
+        # Arrange
+        file = tmp_path / "dataset.json"
+
+        # Act
+        mctrainer_dataset.write_json(file)
+        ied = InfoExtractionDataset.read_json(file)
+
+        # Assert
+        assert ied == mctrainer_dataset
+
     def test_num_docs(self, mctrainer_dataset):
         # Act
         num_docs = mctrainer_dataset.num_docs()
@@ -712,6 +855,44 @@ class TestMetrics:
             "f1": 0.9,
         }
 
+    def test_qualifier_metrics_after_mutation(self):
+        # Arrange
+        negated = [Qualifier(name="Negation", value="Negated")]
+        true = InfoExtractionDataset(
+            docs=[
+                Document(
+                    identifier="1",
+                    text="test1 and test2",
+                    annotations=[
+                        Annotation("test1", 0, 5, "test", qualifiers=negated),
+                        Annotation("test2", 10, 15, "test", qualifiers=negated),
+                    ],
+                )
+            ]
+        )
+        pred = InfoExtractionDataset(
+            docs=[
+                Document(
+                    identifier="1",
+                    text="test1 and test2",
+                    annotations=[
+                        Annotation("test1", 0, 5, "test", qualifiers=negated),
+                    ],
+                )
+            ]
+        )
+        iem = InfoExtractionMetrics(true, pred)
+        _ = iem.qualifier_metrics()
+
+        # Act
+        pred.docs[0].annotations.append(
+            Annotation("test2", 10, 15, "test", qualifiers=negated)
+        )
+        metrics = iem.qualifier_metrics()
+
+        # Assert
+        assert metrics["Negation"]["metrics"]["n"] == 2
+
     def test_qualifier_metrics_misses(self, mctrainer_dataset, clinlp_dataset):
         # Arrange
         iem = InfoExtractionMetrics(mctrainer_dataset, clinlp_dataset)
@@ -724,3 +905,13 @@ class TestMetrics:
         assert len(metrics["Experiencer"]["misses"]) == 0
         assert len(metrics["Plausibility"]["misses"]) == 1
         assert len(metrics["Temporality"]["misses"]) == 1
+
+    def test_qualifier_metrics_n_process(self, mctrainer_dataset, clinlp_dataset):
+        # Arrange
+        iem = InfoExtractionMetrics(mctrainer_dataset, clinlp_dataset)
+
+        # Act
+        metrics = iem.qualifier_metrics(n_process=2)
+
+        # Assert
+        assert metrics == iem.qualifier_metrics()
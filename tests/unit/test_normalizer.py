@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 from spacy import Vocab
 from spacy.tokens import Doc
@@ -92,6 +94,29 @@ class TestNormalizer:
         # Assert
         assert non_ascii == expected_non_ascii_string
 
+    @pytest.mark.parametrize(
+        "input_string",
+        [
+            "abcde",
+            "ABCDE",
+            "Patiënt",
+            "ÄBCDÉ",
+            "µg",
+            "Straße",
+            "ΣΑΣ",
+            "1.6M²",
+        ],
+    )
+    def test_lowercase_and_map_non_ascii(self, input_string):
+        # Arrange
+        n = Normalizer()
+
+        # Act
+        normalized = n._lowercase_and_map_non_ascii(input_string)
+
+        # Assert
+        assert normalized == n._map_non_ascii_string(n._lowercase(input_string))
+
     def test_call_normalizer_default(self, mock_doc):
         # Arange
         expected_norms = ["patient", "250", "μg", "toedienen"]
@@ -136,3 +161,42 @@ class TestNormalizer:
         ):
             assert original_token.text == token.text
             assert token.norm_ == expected_norm
+
+    def test_call_normalizer_disable_all(self, mock_doc):
+        # Arange
+        expected_norms = ["Patiënt", "250", "µg", "toedienen"]
+        n = Normalizer(lowercase=False, map_non_ascii=False)
+
+        # Act
+        doc = n(mock_doc)
+
+        # Assert
+        for original_token, token, expected_norm in zip(
+            mock_doc, doc, expected_norms, strict=False
+        ):
+            assert original_token.text == token.text
+            assert token.norm_ == expected_norm
+
+    def test_pickle_normalizer(self, mock_doc):
+        # Arange
+        expected_norms = ["patient", "250", "μg", "toedienen"]
+        n = Normalizer()
+
+        # Act
+        doc = pickle.loads(pickle.dumps(n))(mock_doc)
+
+        # Assert
+        for token, expected_norm in zip(doc, expected_norms, strict=False):
+            assert token.norm_ == expected_norm
+
+    def test_normalizer_settings_read_only(self):
+        # Arrange
+        n = Normalizer(lowercase=False)
+
+        # Assert
+        with pytest.raises(AttributeError):
+            # Act
+            n.lowercase = True
+
+        assert n.lowercase is False
+        assert n.map_non_ascii is True
@@ -1,6 +1,8 @@
 from unittest.mock import patch
 
 import pytest
+from spacy.tokens import Doc
+from spacy.vocab import Vocab
 from tests.conftest import MockToken, get_mock_tokens
 
 from clinlp import Sentencizer
@@ -133,13 +135,13 @@ class TestUnitClinlpSentencizer:
     def test_sentencizer_call(self):
         # Arrange
         s = Sentencizer()
-        tokens = get_mock_tokens(["Dit", "is", "een", "test"])
-        expected_returns = [True, False, False, False]
+        doc = Doc(Vocab(), words=["Dit", "is", "een", "test"])
+        expected_returns = [True, False, True, False]
 
         # Act
         with patch.object(s, "_compute_sentence_starts", lambda _: expected_returns):
-            s(tokens)
+            s(doc)
 
         # Assert
-        for token, expected_return in zip(tokens, expected_returns, strict=False):
+        for token, expected_return in zip(doc, expected_returns, strict=True):
             assert token.is_sent_start == expected_return
@@ -163,6 +163,23 @@ class TestUnitGetClassInitSignature:
         assert args == ["a", "b"]
         assert defaults == {"b": "test"}
 
+    def test_returns_copies(self):
+        # Arrange
+        class MyClass:
+            def __init__(self, a, b=2):
+                pass
+
+        args, defaults = get_class_init_signature(MyClass)
+        args.append("c")
+        defaults["c"] = 3
+
+        # Act
+        args, defaults = get_class_init_signature(MyClass)
+
+        # Assert
+        assert args == ["a", "b"]
+        assert defaults == {"b": 2}
+
 
 class TestUnitClinlpComponent:
     def test_only_args_class(self, component_1):